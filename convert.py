@@ -14,7 +14,6 @@ file for unsupported extensions. Supported extensions include ttf, woff, woff2.
 """
 
 import sys
-import fontforge
 
 
 def main():
@@ -22,6 +21,10 @@ def main():
         print(f"Usage: {sys.argv[0]} INPUT OUTPUT", file=sys.stderr)
         return 2
 
+    # Deferred: fontforge takes hundreds of ms to initialize, which the
+    # usage-error path above shouldn't pay.
+    import fontforge
+
     in_path = sys.argv[1]
     out_path = sys.argv[2]
 
@@ -0,0 +1,701 @@
+#!/usr/bin/env fontforge
+
+"""
+A fontforge Python script for diffing two font files (.sfd, .ttf, ...).
+
+Prints a summary of the differences between font A and font B: changed
+font-wide metrics, glyphs present in only one font, and per-glyph changes
+(width, references, outlines, ...). Outline changes are detected by hashing
+a normalized form of each glyph's contours and references, so the report is
+stable across coordinate-preserving round trips through fontforge.
+
+This is meant to help review changes to white-bunnybat.sfd: run it against
+the version of the .sfd on master and your edited copy to see exactly which
+glyphs your change touches.
+
+fontforge is the only supported backend: the repo's source of truth is the
+.sfd project file, which fontTools cannot read, and converting to .ttf first
+would both cost more than it saves and diff the converted output rather than
+the actual source.
+"""
+
+import hashlib
+import heapq
+import os
+import pickle
+import re
+import struct
+import sys
+
+import fontforge
+
+# numpy is optional: fontforge's embedded Python does not always ship with
+# it. The pure-Python fallbacks below are equivalent, just slower.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Font-wide attributes worth reporting. Some of these are absent on older
+# fontforge builds, hence the getattr defaults in font_metrics.
+FONT_METRIC_ATTRS = [
+    "fontname",
+    "familyname",
+    "fullname",
+    "weight",
+    "version",
+    "em",
+    "ascent",
+    "descent",
+    "italicangle",
+    "upos",
+    "uwidth",
+]
+
+
+def font_metrics(font):
+    """Snapshot the font-wide attributes we report on."""
+    return {attr: getattr(font, attr, None) for attr in FONT_METRIC_ATTRS}
+
+
+def normalize_transform(transform, inv_em):
+    """Normalize a reference's psMat transform for comparison.
+
+    The scale/skew components are unit-free; the translation components are
+    in em units, so scale them by 1/em to make the result em-independent.
+    """
+    xx, xy, yx, yy, dx, dy = transform
+    return [
+        round(xx, 8),
+        round(xy, 8),
+        round(yx, 8),
+        round(yy, 8),
+        round(dx * inv_em, 8),
+        round(dy * inv_em, 8),
+    ]
+
+
+def _hash_contour(h, pts, closed, inv_em):
+    """Feed one contour's normalized points into the rolling hasher."""
+    n = len(pts)
+    h.update(b"C")
+    h.update(struct.pack("<I?", n, closed))
+    if np is not None:
+        # Normalize the whole contour in three vectorized ops instead
+        # of one round() and one struct.pack per point.
+        arr = np.array(pts, dtype=np.float64).reshape(n, 3)
+        xy = arr[:, :2] * inv_em
+        np.round(xy, 8, out=xy)
+        h.update(xy.tobytes())
+        h.update(arr[:, 2].astype(np.uint8).tobytes())
+    else:
+        pack = struct.pack
+        for x, y, on in pts:
+            h.update(pack("<ddB", round(x * inv_em, 8), round(y * inv_em, 8), on))
+
+
+class GlyphSnap:
+    """Comparable state of one glyph.
+
+    __slots__ keeps the many thousands of instances a large font produces
+    compact (no per-instance dict) and makes field reads C-level slot
+    lookups. Slot order doubles as the comparison order in __eq__: cheap
+    scalar fields first so unequal snapshots bail out early, raw_points
+    last.
+    """
+
+    __slots__ = (
+        "width",
+        "vwidth",
+        "unicode",
+        "encoding",
+        "references",
+        "contour_count",
+        "bbox",
+        "em",
+        "closed",
+        "stats",
+        "raw_points",
+    )
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields[name])
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, GlyphSnap):
+            return NotImplemented
+        for name in self.__slots__:
+            if getattr(self, name) != getattr(other, name):
+                return False
+        return True
+
+    __hash__ = None
+
+
+# The fields snap_diff compares, in display order. The rest of the slots
+# are derived views of the outline, covered by outlines_equal instead.
+COMPARE_FIELDS = (
+    "width",
+    "vwidth",
+    "unicode",
+    "encoding",
+    "references",
+    "contour_count",
+    "bbox",
+)
+
+
+def snap_diff(sa, sb):
+    """Return {field: (a_value, b_value)} for snapshot fields that differ."""
+    diff = {}
+    for fld in COMPARE_FIELDS:
+        va = getattr(sa, fld)
+        vb = getattr(sb, fld)
+        if va != vb:
+            diff[fld] = (va, vb)
+    return diff
+
+
+def glyph_snapshot(g, em):
+    """Capture the comparable state of one glyph as a GlyphSnap.
+
+    References and contours are each walked exactly once; that single pass
+    records the raw points and accumulates the contour/point stats. Every
+    pt.x/pt.y access crosses the fontforge C boundary, so the one-pass
+    structure matters for speed.
+
+    Outline equality is decided directly from the captured points (see
+    outlines_equal); the blake2b digest is only computed on demand for
+    glyphs whose outline actually changed, so unchanged glyphs - the vast
+    majority in a typical edit - never pay for hashing at all.
+    """
+    bbox = g.boundingBox()
+    inv_em = 1.0 / em  # multiply per point/ref instead of dividing
+    # sys.intern dedups refnames ("A", "period", ...) repeated across many
+    # glyphs: one retained string each, and pointer-fast equality checks.
+    refs = g.references
+    if np is not None and len(refs) >= 4:
+        # Composite-heavy glyph: normalize every transform in one
+        # vectorized divide/round instead of per-reference loops.
+        ts = np.array([t for _, t in refs], dtype=np.float64).reshape(-1, 6)
+        ts[:, 4:6] *= inv_em
+        np.round(ts, 8, out=ts)
+        references = frozenset(
+            (sys.intern(refs[i][0]), tuple(row))
+            for i, row in enumerate(ts.tolist())
+        )
+    else:
+        references = frozenset(
+            (sys.intern(refname), tuple(normalize_transform(transform, inv_em)))
+            for refname, transform in refs
+        )
+    raw_points = []
+    closed = []
+    points = 0
+    on_curve = 0
+    for contour in g.foreground:
+        pts = [(pt.x, pt.y, bool(pt.on_curve)) for pt in contour]
+        raw_points.append(pts)
+        closed.append(bool(contour.closed))
+        points += len(pts)
+        on_curve += sum(1 for _, _, on in pts if on)
+    # Direct attribute reads: these always exist on fontforge glyphs, and
+    # getattr-with-default costs extra in the hottest loop.
+    return GlyphSnap(
+        unicode=g.unicode,
+        encoding=g.encoding,
+        width=g.width,
+        vwidth=g.vwidth,
+        references=references,
+        contour_count=len(raw_points),
+        bbox=bbox,
+        em=em,
+        closed=closed,
+        raw_points=raw_points,
+        stats={
+            "contours": len(raw_points),
+            "points": points,
+            "on_curve": on_curve,
+        },
+    )
+
+
+def bbox_norm(snap):
+    """Em-normalized bounding box, derived on demand for display."""
+    inv_em = 1.0 / snap.em
+    return tuple(round(v * inv_em, 8) for v in snap.bbox)
+
+
+def _norm_points(snap):
+    """Em-normalized view of a snapshot's points, for cross-em comparison."""
+    inv_em = 1.0 / snap.em
+    return [
+        [(round(x * inv_em, 8), round(y * inv_em, 8), on) for x, y, on in pts]
+        for pts in snap.raw_points
+    ]
+
+
+def outlines_equal(sa, sb):
+    """Whether two snapshots' contours match (references diffed separately)."""
+    if sa.closed != sb.closed:
+        return False
+    if sa.em == sb.em:
+        return sa.raw_points == sb.raw_points
+    return _norm_points(sa) == _norm_points(sb)
+
+
+def outline_signature(snap):
+    """Outline digest for display, computed lazily from a snapshot.
+
+    blake2b over em-normalized packed records: fast, and only required to
+    be collision resistant within one run (digests are not stable across
+    diff.py versions).
+    """
+    h = hashlib.blake2b(digest_size=16)
+    inv_em = 1.0 / snap.em
+    for refname, norm in sorted(snap.references):
+        h.update(b"R")
+        h.update(refname.encode("utf-8"))
+        h.update(struct.pack("<6d", *norm))
+    for pts, closed in zip(snap.raw_points, snap.closed):
+        _hash_contour(h, pts, closed, inv_em)
+    return h.hexdigest()
+
+
+def glyph_key(g):
+    return sys.intern(g.glyphname or f"enc{g.encoding}")
+
+
+_NAT_SPLIT = re.compile(r"(\d+)")
+
+
+def natural_key(name):
+    """Sort key that orders embedded numbers numerically (uni2 < uni10)."""
+    return [int(p) if p.isdigit() else p for p in _NAT_SPLIT.split(name)]
+
+
+def glyph_label(key, snap):
+    cp = snap.unicode
+    if cp is not None and cp >= 0:
+        return f"{key} (U+{cp:04X})"
+    return key
+
+
+def build_index(font):
+    """Snapshot every glyph in the font, keyed by glyph name."""
+    index = {}
+    em = font.em  # one FFI attribute read, not one per glyph
+    for g in font.glyphs():
+        index[glyph_key(g)] = glyph_snapshot(g, em)
+    return index
+
+
+def _index_shard(path, keys):
+    """Worker for build_index_parallel: snapshot one shard of a font.
+
+    fontforge objects are not picklable, so each worker opens its own copy
+    of the font and only the plain snapshot dicts travel back.
+    """
+    font = fontforge.open(path)
+    em = font.em
+    keys = set(keys)
+    index = {}
+    for g in font.glyphs():
+        key = glyph_key(g)
+        if key in keys:
+            index[key] = glyph_snapshot(g, em)
+    font.close()
+    return index
+
+
+def build_index_parallel(font, path, jobs):
+    """Snapshot all glyphs using a pool of worker processes.
+
+    Snapshotting is independent per glyph, so the glyph list is sharded
+    across workers. Only worth it for glyph-heavy fonts; the default
+    (--jobs 1) stays in-process.
+    """
+    import concurrent.futures
+
+    keys = [glyph_key(g) for g in font.glyphs()]
+    shards = [keys[i::jobs] for i in range(jobs)]
+    index = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        for part in pool.map(_index_shard, [path] * jobs, shards):
+            index.update(part)
+    return index
+
+
+_MISSING = object()  # sentinel: distinguishes absent keys from stored None
+
+
+def dict_diff(a, b):
+    """Return {key: (a_value, b_value)} for keys that differ between dicts.
+
+    Walks the smaller dict's keys directly rather than sorting the union:
+    callers impose their own display order, and in the common case (two
+    glyph snapshots) the key sets are identical anyway.
+    """
+    if a == b:  # one C-level compare settles the no-change common case
+        return {}
+    diff = {}
+    swapped = len(a) > len(b)
+    probe, other = (b, a) if swapped else (a, b)
+    for k, pv in probe.items():
+        ov = other.get(k, _MISSING)
+        if pv != ov:
+            if ov is _MISSING:
+                ov = None
+            diff[k] = (ov, pv) if swapped else (pv, ov)
+    for k, ov in other.items():
+        if k not in probe:
+            diff[k] = (ov, None) if swapped else (None, ov)
+    return diff
+
+
+def point_delta_preview(ca, cb, em, limit=10):
+    """Describe how two structurally-equal outlines differ, point by point.
+
+    Takes the two sides' raw_points (as captured by glyph_snapshot) so the
+    fontforge layers never need to be walked again. Returns a list of
+    human-readable lines, or None when the outlines do not have matching
+    contour/point structure (in which case a point-by-point comparison is
+    meaningless).
+    """
+    if len(ca) != len(cb):
+        return None
+    counts = [len(c) for c in ca]
+    if counts != [len(c) for c in cb]:
+        return None
+    if np is not None:
+        return _point_delta_preview_np(ca, cb, counts, em, limit)
+    lines = []
+    shown = 0
+    max_dx = 0.0
+    max_dy = 0.0
+    for ci, (pa, pb) in enumerate(zip(ca, cb)):
+        for pi, ((xa, ya, oa), (xb, yb, ob)) in enumerate(zip(pa, pb)):
+            dx = xb - xa
+            dy = yb - ya
+            max_dx = max(max_dx, abs(dx))
+            max_dy = max(max_dy, abs(dy))
+            if dx == 0 and dy == 0 and oa == ob:
+                continue
+            if shown < limit:
+                lines.append(
+                    _delta_line(ci, pi, (xa, ya, oa), (xb, yb, ob))
+                )
+            shown += 1
+    return _delta_footer(lines, shown, max_dx, max_dy, em, limit)
+
+
+def _delta_line(ci, pi, pa, pb):
+    xa, ya, oa = pa
+    xb, yb, ob = pb
+    return (
+        f"      contour {ci} point {pi}: "
+        f"({xa:g},{ya:g}) -> ({xb:g},{yb:g})"
+        + ("" if oa == ob else f", on_curve {oa} -> {ob}")
+    )
+
+
+def _delta_footer(lines, shown, max_dx, max_dy, em, limit):
+    if shown > limit:
+        lines.append(f"      ... and {shown - limit} more point changes")
+    if shown:
+        lines.append(
+            f"      max delta: dx={max_dx / em:.6f}em dy={max_dy / em:.6f}em"
+        )
+    return lines
+
+
+def _point_delta_preview_np(ca, cb, counts, em, limit):
+    """Vectorized mismatch detection: one array subtraction per glyph and
+    Python-level formatting only for the handful of points displayed."""
+    flat_a = [pt for pts in ca for pt in pts]
+    flat_b = [pt for pts in cb for pt in pts]
+    arr_a = np.array(flat_a, dtype=np.float64).reshape(len(flat_a), 3)
+    arr_b = np.array(flat_b, dtype=np.float64).reshape(len(flat_b), 3)
+    d = arr_b - arr_a
+    if not len(d):
+        return []
+    max_dx = float(np.abs(d[:, 0]).max())
+    max_dy = float(np.abs(d[:, 1]).max())
+    mismatch = np.nonzero(d.any(axis=1))[0]
+    shown = len(mismatch)
+    # Map flat indices back to (contour, point) for display.
+    offsets = np.cumsum([0] + counts)
+    lines = []
+    for idx in mismatch[:limit]:
+        ci = int(np.searchsorted(offsets, idx, side="right")) - 1
+        pi = int(idx - offsets[ci])
+        lines.append(_delta_line(ci, pi, flat_a[idx], flat_b[idx]))
+    return _delta_footer(lines, shown, max_dx, max_dy, em, limit)
+
+
+def _fit_scale_translate_1d(va, vb):
+    """Least-squares fit of vb ~= scale * va + translate for one axis.
+
+    Returns (scale, translate, max_residual).
+    """
+    n = len(va)
+    if n == 0:
+        return 1.0, 0.0, 0.0
+    sum_a = 0.0
+    sum_b = 0.0
+    sum_aa = 0.0
+    sum_ab = 0.0
+    for a, b in zip(va, vb):
+        sum_a += a
+        sum_b += b
+        sum_aa += a * a
+        sum_ab += a * b
+    denom = n * sum_aa - sum_a * sum_a
+    if abs(denom) < 1e-12:
+        scale = 1.0
+        translate = (sum_b - sum_a) / n
+    else:
+        scale = (n * sum_ab - sum_a * sum_b) / denom
+        translate = (sum_b - scale * sum_a) / n
+    max_resid = 0.0
+    for a, b in zip(va, vb):
+        max_resid = max(max_resid, abs(scale * a + translate - b))
+    return scale, translate, max_resid
+
+
+def _fit_scale_translate_np(pts_a, pts_b):
+    """Joint per-axis scale+translate fit over (N,2) coordinate arrays.
+
+    Centers both axes once and derives both scales from one centered-
+    moment pass, so the point arrays are traversed half as often as two
+    independent 1-D fits. Returns (scale, translate, max_residual), each
+    a length-2 array (x, y).
+    """
+    n = len(pts_a)
+    if n >= 128:
+        # Dense glyph: hand the fit to LAPACK. One lstsq per axis on the
+        # [coord, 1] design matrix is better conditioned than the
+        # closed-form moments and runs at BLAS speed.
+        ones = np.ones(n)
+        sx, tx = np.linalg.lstsq(
+            np.column_stack([pts_a[:, 0], ones]), pts_b[:, 0], rcond=None
+        )[0]
+        sy, ty = np.linalg.lstsq(
+            np.column_stack([pts_a[:, 1], ones]), pts_b[:, 1], rcond=None
+        )[0]
+        scale = np.array([sx, sy])
+        translate = np.array([tx, ty])
+    else:
+        mean_a = pts_a.mean(axis=0)
+        mean_b = pts_b.mean(axis=0)
+        da = pts_a - mean_a
+        sxx = (da * da).sum(axis=0)
+        degenerate = sxx < 1e-12
+        safe = np.where(degenerate, 1.0, sxx)
+        scale = np.where(
+            degenerate, 1.0, (da * (pts_b - mean_b)).sum(axis=0) / safe
+        )
+        translate = mean_b - scale * mean_a
+    resid = np.abs(pts_a * scale + translate - pts_b).max(axis=0)
+    return scale, translate, resid
+
+
+def affine_fit_glyph(ca, cb, em):
+    """If B's outline is roughly a scale+translate of A's, describe it.
+
+    Takes the two sides' raw_points. Returns a one-line description, or
+    None when the outlines do not have matching point structure or the
+    fit is poor.
+    """
+    flat_a = [pt for pts in ca for pt in pts]
+    flat_b = [pt for pts in cb for pt in pts]
+    if not flat_a or len(flat_a) != len(flat_b):
+        return None
+    if np is not None:
+        pts_a = np.array(flat_a, dtype=np.float64)[:, :2]
+        pts_b = np.array(flat_b, dtype=np.float64)[:, :2]
+        scale, translate, resid = _fit_scale_translate_np(pts_a, pts_b)
+        sx, sy = scale
+        tx, ty = translate
+        rx, ry = resid
+    else:
+        sx, tx, rx = _fit_scale_translate_1d(
+            [p[0] for p in flat_a], [p[0] for p in flat_b]
+        )
+        sy, ty, ry = _fit_scale_translate_1d(
+            [p[1] for p in flat_a], [p[1] for p in flat_b]
+        )
+    # Only report when the fit actually explains the outline change.
+    if max(rx, ry) > em * 0.001:
+        return None
+    return (
+        f"      ~ B is A scaled ({sx:.4f}, {sy:.4f})"
+        f" translated ({tx / em:+.4f}em, {ty / em:+.4f}em)"
+    )
+
+
+CACHE_DIR = os.path.expanduser("~/.cache/bunnybat")
+
+
+def _cache_file(path):
+    """Cache file for one font, keyed so any change to the font misses."""
+    st = os.stat(path)
+    key = hashlib.blake2b(
+        f"{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.pkl")
+
+
+def load_or_build_index(font, path, jobs, use_cache):
+    """build_index with a persistent per-font cache.
+
+    Re-running against an unchanged font file (the common case while
+    iterating on an edit) skips all snapshot work and just unpickles the
+    index. The key covers path, mtime and size, so edits invalidate it.
+    """
+    cache_file = _cache_file(path) if use_cache else None
+    if cache_file is not None:
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+    if jobs > 1:
+        index = build_index_parallel(font, path, jobs)
+    else:
+        index = build_index(font)
+    if cache_file is not None:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(cache_file, "wb") as f:
+                pickle.dump(index, f, protocol=5)
+        except OSError:
+            pass  # caching is best-effort
+    return index
+
+
+def main():
+    jobs = 1
+    use_cache = True
+    paths = []
+    args = iter(sys.argv[1:])
+    for arg in args:
+        if arg == "--jobs":
+            jobs = int(next(args, "1"))
+        elif arg.startswith("--jobs="):
+            jobs = int(arg.split("=", 1)[1])
+        elif arg == "--no-cache":
+            use_cache = False
+        else:
+            paths.append(arg)
+    if len(paths) != 2:
+        print(
+            f"Usage: {sys.argv[0]} [--jobs N] [--no-cache] FONT_A FONT_B",
+            file=sys.stderr,
+        )
+        return 2
+
+    font_a = fontforge.open(paths[0])
+    font_b = fontforge.open(paths[1])
+
+    # Report lines are buffered and written in one go at the end: one
+    # write() instead of a print() syscall per changed field.
+    buf = []
+    emit = buf.append
+
+    metric_diff = dict_diff(font_metrics(font_a), font_metrics(font_b))
+    if metric_diff:
+        emit("Font metrics:")
+        for fld, (va, vb) in metric_diff.items():
+            emit(f"  {fld}: {va} -> {vb}")
+
+    ia = load_or_build_index(font_a, paths[0], jobs, use_cache)
+    ib = load_or_build_index(font_b, paths[1], jobs, use_cache)
+
+    # Partition keys with one hash probe each rather than materializing
+    # key sets and taking three separate set differences/intersections.
+    only_a = []
+    both = []
+    for k in ia:
+        (both if k in ib else only_a).append(k)
+    only_b = [k for k in ib if k not in ia]
+
+    if only_a:
+        emit(f"Only in A ({len(only_a)}):")
+        # Only the first 50 are shown; nsmallest avoids a full sort.
+        for key in heapq.nsmallest(50, only_a, key=natural_key):
+            emit(f"  {glyph_label(key, ia[key])}")
+        if len(only_a) > 50:
+            emit(f"  ... and {len(only_a) - 50} more")
+
+    if only_b:
+        emit(f"Only in B ({len(only_b)}):")
+        for key in heapq.nsmallest(50, only_b, key=natural_key):
+            emit(f"  {glyph_label(key, ib[key])}")
+        if len(only_b) > 50:
+            emit(f"  ... and {len(only_b) - 50} more")
+
+    changed = 0
+    for key in sorted(both, key=natural_key):
+        sa = ia[key]
+        sb = ib[key]
+        # Fast path: one C-level dict compare settles the common case of a
+        # completely untouched glyph, skipping the per-field diff walk.
+        if sa == sb:
+            continue
+        diff = snap_diff(sa, sb)
+        outline_changed = not outlines_equal(sa, sb)
+        if not diff and not outline_changed:
+            continue
+        changed += 1
+        emit(f"Changed: {glyph_label(key, sb)}")
+        # snap_diff inserts fields in COMPARE_FIELDS order, so iteration
+        # order is already the display order.
+        for fld, (va, vb) in diff.items():
+            if fld == "references":
+                ra, rb = va, vb
+                for ref in sorted(ra - rb):
+                    emit(f"    reference removed: {ref}")
+                for ref in sorted(rb - ra):
+                    emit(f"    reference added: {ref}")
+            elif fld == "bbox":
+                # bbox_norm is derived, so it is computed lazily here
+                # rather than stored (and diffed) on every snapshot.
+                emit(f"    bbox_norm: {bbox_norm(sa)} -> {bbox_norm(sb)}")
+                emit(f"    bbox: {va} -> {vb}")
+            else:
+                emit(f"    {fld}: {va} -> {vb}")
+        if outline_changed:
+            emit(
+                f"    outline: {outline_signature(sa)}"
+                f" -> {outline_signature(sb)}"
+            )
+            if sa.stats != sb.stats:
+                emit(f"    outline stats: {sa.stats} -> {sb.stats}")
+            fit = affine_fit_glyph(sa.raw_points, sb.raw_points, font_a.em)
+            if fit:
+                emit(fit)
+            preview = point_delta_preview(sa.raw_points, sb.raw_points, font_a.em)
+            if preview:
+                emit("    point deltas:")
+                buf.extend(preview)
+
+    emit(
+        f"{changed} changed, {len(only_a)} only in A, "
+        f"{len(only_b)} only in B, {len(both) - changed} unchanged"
+    )
+    font_a.close()
+    font_b.close()
+    buf.append("")
+    sys.stdout.write("\n".join(buf))
+    sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
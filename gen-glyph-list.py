@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+"""
+Generate a plain-text list of the glyphs in an .sfd file.
+
+Writes one line per encoded glyph (codepoint, decimal, the character
+itself, and the glyph name) plus a leading count, which is handy for
+eyeballing coverage and for pasting characters into a test web page.
+
+This parses the .sfd text directly, so it runs under plain python3 and
+does not need fontforge.
+"""
+
+import mmap
+import re
+import sys
+
+# Matches each glyph header in the .sfd: the StartChar name line followed
+# by its Encoding line (slot, unicode, glyph index). Compiled once at
+# import so repeated runs in one interpreter don't re-parse the pattern.
+# Bytes mode: the scanner walks the memory-mapped file directly, with no
+# whole-file UTF-8 decode.
+GLYPH_PAT = re.compile(rb"^StartChar: *(\S+)\s*\nEncoding: -?\d+ (-?\d+) \d+", re.M)
+
+
+def main():
+    if len(sys.argv) > 3:
+        print(f"Usage: {sys.argv[0]} [INPUT.sfd] [OUTPUT.txt]", file=sys.stderr)
+        return 2
+
+    in_path = sys.argv[1] if len(sys.argv) > 1 else "white-bunnybat.sfd"
+    out_path = sys.argv[2] if len(sys.argv) > 2 else "glyph-list.txt"
+
+    count = 0
+    # Collect lines and join once: repeated str += is quadratic in the
+    # output size once CPython's in-place realloc trick stops applying.
+    parts = []
+    # mmap lets the OS page the .sfd in on demand instead of copying the
+    # whole file into a Python str (and only glyph names ever get decoded).
+    with open(in_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for m in GLYPH_PAT.finditer(mm):
+                name = m.group(1).decode("utf-8")
+                cp = int(m.group(2))
+                if cp < 0:
+                    # Unencoded glyphs (.notdef etc.) have no character
+                    # to list.
+                    continue
+                count += 1
+                parts.append(f"U+{cp:04X} | {cp:7} | {chr(cp)} | {name}\n")
+
+    glyph_list = f"count: {count}\n" + "".join(parts)
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(glyph_list)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,363 @@
+#!/usr/bin/env fontforge
+
+"""
+A fontforge Python script that generates test pages for the font.
+
+Produces showcase/showcase.html (every encoded glyph in a grid, grouped by
+Unicode block, with names and codepoints) and showcase/showcase.js (the
+same data as a payload that renders one line of text per block). Open the
+HTML in a browser after running build.sh to eyeball your changes in the
+actual font. In-game rendering still differs (see README), but this
+catches missing glyphs, wrong widths, and obvious shape mistakes early.
+"""
+
+import bisect
+import json
+import os
+import sys
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+
+import fontforge
+
+try:
+    import numpy as np
+except ImportError:  # optional; the scalar paths below work without it
+    np = None
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json produces identical payloads
+    orjson = None
+
+
+# The Unicode blocks the showcase knows how to label. (start, end, name);
+# covers everything this font encodes plus nearby blocks contributors are
+# likely to add to. Unlisted codepoints fall into "Other".
+BLOCKS = [
+    (0x0000, 0x007F, "Basic Latin"),
+    (0x0080, 0x00FF, "Latin-1 Supplement"),
+    (0x0100, 0x017F, "Latin Extended-A"),
+    (0x0180, 0x024F, "Latin Extended-B"),
+    (0x0250, 0x02AF, "IPA Extensions"),
+    (0x02B0, 0x02FF, "Spacing Modifier Letters"),
+    (0x0300, 0x036F, "Combining Diacritical Marks"),
+    (0x0370, 0x03FF, "Greek and Coptic"),
+    (0x0400, 0x04FF, "Cyrillic"),
+    (0x1E00, 0x1EFF, "Latin Extended Additional"),
+    (0x2000, 0x206F, "General Punctuation"),
+    (0x2070, 0x209F, "Superscripts and Subscripts"),
+    (0x20A0, 0x20CF, "Currency Symbols"),
+    (0x2100, 0x214F, "Letterlike Symbols"),
+    (0x2150, 0x218F, "Number Forms"),
+    (0x2190, 0x21FF, "Arrows"),
+    (0x2200, 0x22FF, "Mathematical Operators"),
+    (0x2300, 0x23FF, "Miscellaneous Technical"),
+    (0x2500, 0x257F, "Box Drawing"),
+    (0x2580, 0x259F, "Block Elements"),
+    (0x25A0, 0x25FF, "Geometric Shapes"),
+    (0x2600, 0x26FF, "Miscellaneous Symbols"),
+    (0x2700, 0x27BF, "Dingbats"),
+    (0xE000, 0xF8FF, "Private Use Area"),
+    (0xFB00, 0xFB4F, "Alphabetic Presentation Forms"),
+    (0xFFF0, 0xFFFF, "Specials"),
+]
+
+
+def build_block_index():
+    """Structure-of-arrays view of BLOCKS for bisect lookup.
+
+    Parallel arrays of starts and ends keep the search in C-level int
+    comparisons; a linear scan over the block list per glyph would be
+    O(glyphs x blocks) of Python tuple indexing.
+    """
+    starts = array("i", (b[0] for b in BLOCKS))
+    ends = array("i", (b[1] for b in BLOCKS))
+    names = [b[2] for b in BLOCKS]
+    return starts, ends, names
+
+
+def block_for_codepoint(cp, starts, ends, names):
+    """Name of the Unicode block containing cp, or "" if unlisted."""
+    i = bisect.bisect_right(starts, cp) - 1
+    if i >= 0 and cp <= ends[i]:
+        return names[i]
+    return ""
+
+
+# C0 controls, DEL, and soft hyphen (renders invisibly).
+_NOT_PRINTABLE = frozenset(range(0x20)) | {0x7F, 0x00AD}
+
+
+def is_printable_for_showcase(cp):
+    """Whether the showcase should render the character itself."""
+    return cp not in _NOT_PRINTABLE
+
+
+# Each of these is a Python->C round trip into FontForge's NamesList data,
+# which dominates the per-glyph cost. They return None (not raise) on
+# misses, so no try/except is needed, and memoizing means a codepoint
+# reachable from several glyph slots only pays the FFI once.
+@lru_cache(maxsize=None)
+def unicode_name(cp):
+    return fontforge.UnicodeNameFromLib(cp) or ""
+
+
+@lru_cache(maxsize=None)
+def unicode_alias(cp):
+    return fontforge.UnicodeNames2FromLib(cp) or ""
+
+
+@lru_cache(maxsize=None)
+def _name_from_unicode(cp):
+    return fontforge.nameFromUnicode(cp) or ""
+
+
+def glyph_name_for_codepoint(cp, font_glyphname=None):
+    """Best display name for a codepoint's glyph.
+
+    The font's own name wins, so the nameFromUnicode FFI call is only
+    made for the rare unnamed glyph.
+    """
+    if font_glyphname:
+        return font_glyphname
+    n = _name_from_unicode(cp)
+    if n:
+        return n
+    return "uni%04X" % cp if cp <= 0xFFFF else "u%06X" % cp
+
+
+def make_contiguous_ranges(sorted_codepoints):
+    """Collapse a sorted codepoint list into (start, end) runs."""
+    n = len(sorted_codepoints)
+    if np is not None and n >= 512:
+        # Run boundaries fall wherever consecutive codepoints differ by
+        # more than 1; np.diff finds them all in one vectorized pass.
+        cps = np.fromiter(sorted_codepoints, np.int64, n)
+        breaks = np.nonzero(np.diff(cps) != 1)[0]
+        starts = cps[np.concatenate(([0], breaks + 1))]
+        ends = cps[np.concatenate((breaks, [n - 1]))]
+        return list(zip(starts.tolist(), ends.tolist()))
+    ranges = []
+    start = prev = None
+    for cp in sorted_codepoints:
+        if prev is not None and cp == prev + 1:
+            prev = cp
+            continue
+        if prev is not None:
+            ranges.append((start, prev))
+        start = prev = cp
+    if prev is not None:
+        ranges.append((start, prev))
+    return ranges
+
+
+# One C-level pass, versus five chained .replace() calls each allocating
+# an intermediate string. translate is also near-free when nothing matches,
+# which is the common case for glyph names.
+_HTML_ESC = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}
+)
+
+
+def html_escape(s):
+    return s.translate(_HTML_ESC)
+
+
+@lru_cache(maxsize=None)
+def cp_to_uplus(cp):
+    # Cached: range endpoints repeat the codepoints already formatted for
+    # their grid cells.
+    return "U+%04X" % cp
+
+
+# Plain records instead of dicts: the emitters read these fields once per
+# cell, and a namedtuple slot read skips the per-access dict hashing.
+GlyphRow = namedtuple("GlyphRow", "codepoint name unicode_name unicode_alias")
+Range = namedtuple("Range", "start end")
+Block = namedtuple("Block", "name count ranges glyphs")
+
+
+def build_data_full_for_html(uni_unique, starts, ends, names):
+    """Group the deduped glyph rows by Unicode block, Basic Latin first.
+
+    uni_unique arrives sorted and deduped by codepoint (main guarantees
+    this), so the per-block lists accumulate already sorted and unique —
+    no re-sort and no set round-trip needed here.
+    """
+    by_block = {}
+    for item in uni_unique:
+        bname = block_for_codepoint(item.codepoint, starts, ends, names)
+        by_block.setdefault(bname or "Other", []).append(item)
+    block_names = sorted(by_block)
+    # Promote Basic Latin after the plain C-level string sort rather than
+    # paying a tuple-building key per comparison.
+    if "Basic Latin" in by_block:
+        block_names.remove("Basic Latin")
+        block_names.insert(0, "Basic Latin")
+    blocks_out = []
+    for bname in block_names:
+        items = by_block[bname]
+        cps = [x.codepoint for x in items]
+        ranges = [Range(*r) for r in make_contiguous_ranges(cps)]
+        blocks_out.append(Block(bname, len(items), ranges, items))
+    return blocks_out
+
+
+def build_data_slim_for_js(data_full):
+    """Strip the HTML-only fields down to what showcase.js consumes.
+
+    Printability is decided here, at build time, so the payload carries
+    only the codepoints the JS will actually render and the JS loop
+    needs no filtering of its own.
+    """
+    return [
+        {
+            "name": b.name,
+            "codepoints": [
+                g.codepoint
+                for g in b.glyphs
+                if is_printable_for_showcase(g.codepoint)
+            ],
+        }
+        for b in data_full
+    ]
+
+
+HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>white-bunnybat glyph showcase</title>
+<style>
+@font-face {
+  font-family: "white-bunnybat";
+  src: url("../release/white-bunnybat.ttf");
+}
+body { background: #111; color: #ddd; font-family: monospace; }
+h2 { color: #9f9; }
+.ranges { color: #777; }
+.grid { display: flex; flex-wrap: wrap; gap: 4px; }
+.cell { border: 1px solid #333; padding: 4px; width: 7em; overflow: hidden; }
+.glyph { font-family: "white-bunnybat"; font-size: 2em; min-height: 1.2em; }
+.code { color: #9cf; }
+.name { color: #999; font-size: 0.8em; }
+.lines { font-family: "white-bunnybat"; font-size: 1.5em; }
+</style>
+</head>
+<body>
+<h1>white-bunnybat glyph showcase</h1>
+<div id="lines" class="lines"></div>
+<script src="showcase.js"></script>"""
+
+HTML_TAIL = """</body>
+</html>"""
+
+
+def write_html(data_full, out_path):
+    # Stream cells straight to the file rather than accumulating the
+    # whole document in memory first; the large buffer keeps writes from
+    # turning into per-cell syscalls.
+    with open(out_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(HTML_HEAD)
+        for block in data_full:
+            bname = html_escape(block.name)
+            # Codepoint strings only contain [U+0-9A-F-, ]; nothing to
+            # escape there or in the per-cell code field below.
+            ranges_txt = ", ".join(
+                f"{cp_to_uplus(r.start)}-{cp_to_uplus(r.end)}"
+                for r in block.ranges
+            )
+            f.write(
+                f"\n<section>\n<h2>{bname} ({block.count})</h2>\n"
+                f'<p class="ranges">{ranges_txt}</p>\n<div class="grid">\n'
+            )
+            for g in block.glyphs:
+                cp = g.codepoint
+                gname = html_escape(g.name)
+                nm = html_escape(g.unicode_name or g.unicode_alias or "")
+                ch = "&#%d;" % cp if is_printable_for_showcase(cp) else ""
+                f.write(
+                    f'<div class="cell" title="{nm}">'
+                    f'<div class="glyph">{ch}</div>'
+                    f'<div class="code">{cp_to_uplus(cp)}</div>'
+                    f'<div class="name">{gname}</div></div>\n'
+                )
+            f.write("</div>\n</section>")
+        f.write("\n" + HTML_TAIL)
+
+
+def write_js(data_slim, out_path):
+    # orjson serializes compact UTF-8 natively in C; stdlib json walks the
+    # containers in Python. Same bytes either way.
+    if orjson is not None:
+        payload = orjson.dumps(data_slim).decode("utf-8")
+    else:
+        payload = json.dumps(data_slim, ensure_ascii=False, separators=(",", ":"))
+    js = (
+        "// Generated by generate_tests.py - do not edit.\n"
+        f"const BLOCKS = {payload};\n"
+        "const container = document.getElementById(\"lines\");\n"
+        "for (const block of BLOCKS) {\n"
+        "  const line = String.fromCodePoint(...block.codepoints);\n"
+        "  const p = document.createElement(\"p\");\n"
+        "  p.textContent = line;\n"
+        "  p.title = block.name;\n"
+        "  container.appendChild(p);\n"
+        "}\n"
+    )
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(js)
+
+
+def main():
+    if len(sys.argv) > 3:
+        print(f"Usage: {sys.argv[0]} [INPUT.sfd] [OUTDIR]", file=sys.stderr)
+        return 2
+
+    in_path = sys.argv[1] if len(sys.argv) > 1 else "white-bunnybat.sfd"
+    out_dir = sys.argv[2] if len(sys.argv) > 2 else "showcase"
+
+    font = fontforge.open(in_path)
+    uni = []
+    # Glyph objects always expose these attributes; no getattr defaults or
+    # per-glyph try/except needed.
+    for g in font.glyphs():
+        cp = g.unicode
+        if cp < 0 or not g.isWorthOutputting():
+            continue
+        uni.append((cp, g.glyphname))
+    font.close()
+
+    # Dedup before the name lookups so duplicate codepoints never reach
+    # the FFI at all. The list is sorted, so duplicates are adjacent and
+    # a previous-value compare replaces set hashing entirely.
+    uni.sort()
+    uni_unique = []
+    prev = -1
+    for cp, gname in uni:
+        if cp == prev:
+            continue
+        prev = cp
+        uni_unique.append(
+            GlyphRow(
+                cp,
+                glyph_name_for_codepoint(cp, gname),
+                unicode_name(cp),
+                unicode_alias(cp),
+            )
+        )
+
+    starts, ends, names = build_block_index()
+    data_full = build_data_full_for_html(uni_unique, starts, ends, names)
+
+    os.makedirs(out_dir, exist_ok=True)
+    write_html(data_full, os.path.join(out_dir, "showcase.html"))
+    write_js(build_data_slim_for_js(data_full), os.path.join(out_dir, "showcase.js"))
+    print(f"wrote {len(uni_unique)} glyphs in {len(data_full)} blocks to {out_dir}/")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
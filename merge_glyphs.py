@@ -0,0 +1,116 @@
+#!/usr/bin/env fontforge
+
+"""
+A fontforge Python script that copies a range of glyphs from a donor font
+into the project .sfd.
+
+Handy for pulling in a block you have rights to (say, box drawing) from
+another font instead of drawing every glyph by hand. Codepoints are hex,
+optionally prefixed with U+ or 0x, singly or as start-end ranges:
+
+    fontforge merge_glyphs.py white-bunnybat.sfd donor.ttf 2500-257F 2588
+
+The base .sfd is saved in place. Review the result in fontforge before
+committing; donor metrics rarely match ours exactly.
+"""
+
+import sys
+
+import fontforge
+
+
+def parse_codepoint(s):
+    """Parse a hex codepoint, with optional U+ or 0x prefix.
+
+    int(..., 16) already rejects anything a validating regex would, and
+    on tokens this short the regex engine's setup cost dominates.
+    """
+    s = s.strip()
+    if s[:2] in ("U+", "0x"):
+        s = s[2:]
+    try:
+        return int(s, 16)
+    except ValueError:
+        raise ValueError(f"bad codepoint: {s!r}") from None
+
+
+def parse_ranges(tokens):
+    """Parse range tokens into sorted, non-overlapping (start, end) pairs.
+
+    Works on intervals throughout rather than materializing each
+    codepoint into a set — a full-plane range is two ints either way.
+    """
+    spans = []
+    for tok in tokens:
+        lo, sep, hi = tok.partition("-")
+        start = parse_codepoint(lo)
+        end = parse_codepoint(hi) if sep else start
+        if end < start:
+            raise ValueError(f"backwards range: {tok!r}")
+        spans.append((start, end))
+    spans.sort()
+    merged = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def copy_one(base, donor, cp):
+    """Copy one codepoint's glyph and metrics from donor into base.
+
+    Assigns the outline layer and references directly rather than round-
+    tripping through fontforge's clipboard, which costs four selection
+    mutations plus a serialize/deserialize per glyph. References are kept
+    by name, same as a clipboard paste would.
+    """
+    dg = donor[cp]
+    bg = base.createChar(cp)
+    bg.clear()
+    bg.foreground = dg.foreground.dup()
+    bg.references = tuple(dg.references)
+    bg.width = dg.width
+    bg.vwidth = dg.vwidth
+
+
+def main():
+    if len(sys.argv) < 4:
+        print(
+            f"Usage: {sys.argv[0]} BASE.sfd DONOR RANGE [RANGE...]",
+            file=sys.stderr,
+        )
+        return 2
+
+    base_path = sys.argv[1]
+    donor_path = sys.argv[2]
+    try:
+        spans = parse_ranges(sys.argv[3:])
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    base = fontforge.open(base_path)
+    donor = fontforge.open(donor_path)
+
+    copied = 0
+    skipped = 0
+    for start, end in spans:
+        for cp in range(start, end + 1):
+            if donor.findEncodingSlot(cp) == -1:
+                skipped += 1
+                continue
+            copy_one(base, donor, cp)
+            copied += 1
+
+    base.save(base_path)
+    donor.close()
+    base.close()
+    print(f"copied {copied} glyphs, skipped {skipped} missing from donor")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
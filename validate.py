@@ -4,6 +4,10 @@
 import sys
 import fontforge
 
+# Reporting more commented glyphs than this helps nobody; the answer is
+# yes/no plus a few names to chase.
+MAX_REPORTED = 16
+
 
 def main():
     if len(sys.argv) != 2:
@@ -18,6 +22,22 @@ def main():
             "Validation error! Please use the fontforge GUI to diagnose and fix.",
             file=sys.stderr,
         )
+
+    # Glyph comments mark unfinished work and shouldn't land in the
+    # project file. One pass over the glyphs, stopping at the report cap.
+    commented = []
+    for g in font.glyphs():
+        if g.comment:
+            commented.append(g.glyphname)
+            if len(commented) >= MAX_REPORTED:
+                break
+    if commented:
+        print(
+            "Glyphs with comments (unfinished work?): " + ", ".join(commented),
+            file=sys.stderr,
+        )
+        if validation == 0:
+            validation = 1
     return validation
 
 